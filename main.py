@@ -20,17 +20,17 @@ def element_table(transformer, element: str = "ocx:Vessel"):
         ocx = transformer.get_ocx_element_from_type(element)
         if ocx:
             print(f"Table of {element}:")
-            print(tabulate(ocx.children_to_dict(), headers="keys"))
-            print(tabulate(ocx.attributes_to_dict(), headers="keys"))
+            headers, rows = ocx.children_table
+            print(tabulate(rows, headers=headers))
+            headers, rows = ocx.attributes_table
+            print(tabulate(rows, headers=headers))
 
 
 def enum_values(transformer, target: str = "functionType"):
     if transformer.is_transformed():
-        enums = transformer.get_enumerators()
-        for key in enums:
-            enum = enums[key]
-            if enum.name == target:
-                print(tabulate(enum.to_dict(), headers="keys"))
+        enum = transformer.get_enumerator_with_name(target)
+        if enum:
+            print(tabulate(enum.to_dict(), headers="keys"))
 
 
 def enum_types(transformer):
@@ -57,9 +57,9 @@ def simple_type(transformer, target="all"):
             for type in transformer.get_simple_types():
                 print(type.to_dict())
         else:
-            for type in transformer.get_simple_types():
-                if type.name == target:
-                    print(type.to_dict())
+            type = transformer.get_simple_type_with_name(target)
+            if type:
+                print(type.to_dict())
 
 
 def elements(transformer, target="Vessel"):
@@ -70,9 +70,9 @@ def elements(transformer, target="Vessel"):
 
 def attribute(transformer, target="GUIDRef"):
     if transformer.is_transformed():
-        for type in transformer.get_global_attributes():
-            if type.name == target:
-                print(type)
+        type = transformer.get_global_attribute_with_name(target)
+        if type:
+            print(type)
 
 
 def substitution_groups(transformer):
@@ -6,19 +6,20 @@ __version__ = "1.8.0"
 from loguru import logger
 
 # Application imports
-from ocx_schema_parser.config import config
+from ocx_schema_parser.config import config, get_list
 
 SCHEMA_FOLDER = config.get("SchemaParserSettings", "schema_folder")
 TMP_FOLDER = config.get("SchemaParserSettings", "tmp_folder")
 WORKING_DRAFT = config.get("SchemaParserSettings", "working_draft")
 DEFAULT_SCHEMA = config.get("SchemaParserSettings", "schema_url")
-keys = config.get("SchemaParserSettings", "w3c_schema_builtin_keys").split()
-values = config.get("SchemaParserSettings", "w3c_schema_builtin_values").split()
-W3C_SCHEMA_BUILT_IN_TYPES = dict(zip(keys, values))
-PROCESS_SCHEMA_TYPES = config.get(
-    "SchemaParserSettings", "process_schema_types"
-).split()
-ALLOWED_WORDS = config.get("SchemaParserSettings", "known_word_list").split()
-OCX_NAME_EXCEPTIONS = config.get("SchemaParserSettings", "ocx_name_exceptions").split()
+W3C_SCHEMA_BUILT_IN_TYPES = dict(
+    zip(
+        get_list("SchemaParserSettings", "w3c_schema_builtin_keys"),
+        get_list("SchemaParserSettings", "w3c_schema_builtin_values"),
+    )
+)
+PROCESS_SCHEMA_TYPES = list(get_list("SchemaParserSettings", "process_schema_types"))
+ALLOWED_WORDS = list(get_list("SchemaParserSettings", "known_word_list"))
+OCX_NAME_EXCEPTIONS = list(get_list("SchemaParserSettings", "ocx_name_exceptions"))
 
 logger.disable(__name__)
@@ -4,14 +4,14 @@
 from collections import defaultdict
 from typing import Dict, Set, Tuple
 
-import inflection
-
 #  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
 from spellchecker import SpellChecker
 
 from ocx_schema_parser import ALLOWED_WORDS, OCX_NAME_EXCEPTIONS
 from ocx_schema_parser.transformer import Transformer
 
+_NAME_EXCEPTIONS = frozenset(OCX_NAME_EXCEPTIONS)
+
 
 class SchemaCheck:
     """The SchemaCheck provides functionality for checking the conformance of the OCX schema XSD.
@@ -56,21 +56,27 @@ class SchemaCheck:
     def is_camel_case(name: str) -> bool:
         """Return True if the name is camel case conform.
 
+        The name conforms if its first character is upper case and it has no underscore
+        between its first and last characters.
+
         Arguments:
             name: The name to verify
 
 
         """
-        return inflection.camelize(name, True) == name
+        return not name or (name[0].upper() == name[0] and "_" not in name[1:-1])
 
     @staticmethod
     def is_dromedary_case(name: str) -> bool:
         """Return True if the name is dromedary case conform.
 
+        The name conforms if its first character is lower case and it has no underscore
+        between its first and last characters.
+
         Arguments:
             name: The string to verify
         """
-        return inflection.camelize(name, False) == name
+        return not name or (name[0].lower() == name[0] and "_" not in name[1:-1])
 
     def check_schema_name_conformance(self) -> Tuple[bool, Dict]:
         """Check the conformance of the OCX schema names.
@@ -83,27 +89,25 @@ class SchemaCheck:
         failures = defaultdict(list)
         for e in self._transformer.ocx_iterator():
             name = e.get_name()
-            if self.is_camel_case(name) is not True and name not in OCX_NAME_EXCEPTIONS:
+            if not self.is_camel_case(name) and name not in _NAME_EXCEPTIONS:
                 result = False
                 failures["camel_case"].append(name)
-            children = e.get_children()
-            for child in children:
-                name = child.name
-                if (
-                    self.is_camel_case(name) is not True
-                    and name not in OCX_NAME_EXCEPTIONS
-                ):
-                    print(name)
-                    failures["camel_case"].append(name)
-            attributes = e.get_attributes()
-            for attr in attributes:
-                name = attr.name
-                if (
-                    self.is_dromedary_case(name) is not True
-                    and name not in OCX_NAME_EXCEPTIONS
-                ):
-                    print(name)
-                    failures["dromedary_case"].append(name)
+            camel_case = [
+                child.name
+                for child in e.get_children()
+                if not self.is_camel_case(child.name)
+                and child.name not in _NAME_EXCEPTIONS
+            ]
+            if camel_case:
+                failures["camel_case"].extend(camel_case)
+            dromedary_case = [
+                attr.name
+                for attr in e.get_attributes()
+                if not self.is_dromedary_case(attr.name)
+                and attr.name not in _NAME_EXCEPTIONS
+            ]
+            if dromedary_case:
+                failures["dromedary_case"].extend(dromedary_case)
         return result, failures
 
     def check_schema_conformance(self, namespace: str) -> bool:
@@ -1,5 +1,7 @@
 #  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
 import configparser
+from functools import lru_cache
+from typing import Tuple
 
 # Create a ConfigParser object
 config = configparser.ConfigParser()
@@ -77,3 +79,20 @@ config["SchemaParserSettings"] = {
         originating_system
         time_stamp""",
 }
+
+
+@lru_cache(maxsize=None)
+def get_list(section: str, key: str) -> Tuple[str, ...]:
+    """The whitespace separated values of a configuration option.
+
+    The settings are static, so each option is only split once.
+
+    Args:
+        section: The configuration section
+        key: The option name
+
+    Returns:
+        The option values as a tuple of strings
+
+    """
+    return tuple(config.get(section, key).split())
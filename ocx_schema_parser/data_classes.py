@@ -1,10 +1,17 @@
 """The data_classes module contains the dataclasses holding schema attributes after parsing."""
 #  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
 from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 
-@dataclass
+@lru_cache(maxsize=None)
+def _headers(cls) -> Tuple[Tuple[str, str], ...]:
+    """The (header, field name) pairs of a dataclass, read once per class."""
+    return tuple((f.metadata["header"], f.name) for f in fields(cls))
+
+
+@dataclass(slots=True)
 class BaseDataClass:
     """Base class for OCX dataclasses.
 
@@ -16,14 +23,10 @@ class BaseDataClass:
 
     def to_dict(self) -> Dict:
         """Output the data class as a dict with field names as keys."""
-        my_fields = fields(self)
-        return {
-            my_fields[i].metadata["header"]: value
-            for i, (key, value) in enumerate(self.__dict__.items())
-        }
+        return {header: getattr(self, name) for header, name in _headers(type(self))}
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaChange(BaseDataClass):
     """Class for keeping track of OCX schema changes.
 
@@ -41,7 +44,7 @@ class SchemaChange(BaseDataClass):
     description: str = field(default="", metadata={"header": "Description"})
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaType(BaseDataClass):
     """Class for xsd schema type information.
 
@@ -60,7 +63,7 @@ class SchemaType(BaseDataClass):
     # annotation: str = field(default='', metadata={"header": "Description"})
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaSummary(BaseDataClass):
     """Class for schema summary information.
 
@@ -76,7 +79,7 @@ class SchemaSummary(BaseDataClass):
     schema_namespaces: List[Tuple] = field(metadata={"header": "Namespaces"})
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaAttribute(BaseDataClass):
     """Schema attribute type class.
 
@@ -95,7 +98,7 @@ class SchemaAttribute(BaseDataClass):
     description: str = field(default="", metadata={"header": "Description"})
 
 
-@dataclass
+@dataclass(slots=True)
 class OcxEnumerator:
     """Enumerator class.
 
@@ -118,7 +121,7 @@ class OcxEnumerator:
         return {"Value": self.values, "Description": self.descriptions}
 
 
-@dataclass
+@dataclass(slots=True)
 class OcxSchemaAttribute(BaseDataClass):
     """Attribute class.
 
@@ -141,7 +144,7 @@ class OcxSchemaAttribute(BaseDataClass):
     description: str = field(default="", metadata={"header": "Description"})
 
 
-@dataclass
+@dataclass(slots=True)
 class OcxSchemaChild(BaseDataClass):
     """Child element  class.
 
@@ -1,7 +1,8 @@
 """The OCX Schema content classes."""
 #  Copyright (c) 2022-2023. OCX Consortium https://3docx.org. See the LICENSE
+import sys
 from collections import defaultdict
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from loguru import logger
 
@@ -30,20 +31,51 @@ class OcxGlobalElement:
         _children: List of references to all children schema types with tag as key.
                         Includes also children of all super-types.
         -assertions: List of any assertions associated with the ``xs:element``
+        _attributes_by_name: The attributes with the attribute name as key, None until computed
+        _attributes_table: The attributes table, None until computed
+        _children_table: The children table, None until computed
+        _substitution_group: The ``substitutionGroup`` of the ``xs:element``, None if not a member
+        _abstract: Whether the ``xs:element`` is abstract
 
     """
 
+    __slots__ = (
+        "_element",
+        "_attributes",
+        "_namespace",
+        "_tag",
+        "_cardinality",
+        "_children",
+        "_parents",
+        "_assertions",
+        "_namespaces",
+        "_prefix",
+        "_attributes_by_name",
+        "_attributes_table",
+        "_children_table",
+        "_substitution_group",
+        "_abstract",
+    )
+
     def __init__(self, xsd_element: Element, unique_tag: str, namespaces: Dict):
         # Private
         self._element: Element = xsd_element
         self._attributes: List[OcxSchemaAttribute] = []
-        self._namespace: str = QName(unique_tag).namespace
-        self._tag: str = unique_tag
+        self._namespace: str = sys.intern(QName(unique_tag).namespace)
+        self._tag: str = sys.intern(unique_tag)
         self._cardinality: tuple = LxmlElement.cardinality(xsd_element)
         self._children: List = []
         self._parents: Dict = {}
         self._assertions: List = []
         self._namespaces: Dict = namespaces
+        self._prefix: Union[str, None] = ""
+        self._attributes_by_name: Union[Dict, None] = None
+        self._attributes_table: Union[Tuple[List, List], None] = None
+        self._children_table: Union[Tuple[List, List], None] = None
+        self._substitution_group: Union[str, None] = LxmlElement.get_substitution_group(
+            xsd_element
+        )
+        self._abstract: bool = LxmlElement.is_abstract(xsd_element)
 
     def add_attribute(self, attribute: OcxSchemaAttribute):
         """Add attributes to the global element.
@@ -53,6 +85,8 @@ class OcxGlobalElement:
 
         """
         self._attributes.append(attribute)
+        self._attributes_by_name = None
+        self._attributes_table = None
 
     def add_child(self, child: OcxSchemaChild):
         """Add a child of an OCX global element'
@@ -65,6 +99,7 @@ class OcxGlobalElement:
 
         """
         self._children.append(child)
+        self._children_table = None
 
     def add_assertion(self, test: str):
         """Add an assertion test associated to me
@@ -154,6 +189,22 @@ class OcxGlobalElement:
         """
         return self._attributes
 
+    def get_attribute_by_name(self, name: str) -> Union[OcxSchemaAttribute, None]:
+        """The global element attribute with name ``name``. The first attribute with the name wins.
+
+        Arguments:
+            name: The attribute name
+
+        Returns:
+            The attribute, None if the element has no attribute with the name
+
+        """
+        if self._attributes_by_name is None:
+            self._attributes_by_name = {}
+            for attribute in self._attributes:
+                self._attributes_by_name.setdefault(attribute.name, attribute)
+        return self._attributes_by_name.get(name)
+
     def get_name(self) -> str:
         """The global element name
 
@@ -190,22 +241,18 @@ class OcxGlobalElement:
             The namespace prefix of the global schema element
 
         """
-        nsprefix = list(iter(self._namespaces))
-        nstags = list(iter(self._namespaces.values()))
-        prefix = ""
-        try:
-            index = nstags.index(self._namespace)
-            prefix = nsprefix[index]
-            if prefix is None:
-                nstags.pop(index)
-                nsprefix.pop(index)
-                index = nstags.index(self._namespace)
-                prefix = nsprefix.index(index)
-        except ValueError as e:
-            logger.error(f"{self._namespace} is not in the namespace list: {e}")
-        if prefix == "":
-            logger.debug(f"Empty namespace prefix in global elem,ent {self.get_name()}")
-        return prefix
+        if self._prefix == "":
+            self._prefix = next(
+                (
+                    prefix
+                    for prefix, namespace in self._namespaces.items()
+                    if namespace == self._namespace
+                ),
+                "",
+            )
+            if self._prefix == "":
+                logger.error(f"{self._namespace} is not in the namespace list")
+        return self._prefix
 
     def get_schema_element(self) -> Element:
         """Get the schema xsd element of the ``OcxSchemeElement`` object
@@ -271,7 +318,7 @@ class OcxGlobalElement:
             True if the element is a substitutionGroup, False otherwise
 
         """
-        return LxmlElement.is_substitution_group(self._element)
+        return self._substitution_group is not None
 
     def is_abstract(self) -> bool:
         """Whether the element is abstract
@@ -280,7 +327,7 @@ class OcxGlobalElement:
             True if the element is abstract, False otherwise
 
         """
-        return LxmlElement.is_abstract(self._element)
+        return self._abstract
 
     def get_substitution_group(self) -> Union[str, None]:
         """Return the name of the substitutionGroup
@@ -289,7 +336,7 @@ class OcxGlobalElement:
             The name of the ``substitutionGroup``, None otherwise
 
         """
-        return LxmlElement.get_substitution_group(self._element)
+        return self._substitution_group
 
     def get_tag(self) -> str:
         """The global schema element unique tag
@@ -383,3 +430,38 @@ class OcxGlobalElement:
             for a in attributes:
                 table[a].append(attributes[a])
         return table
+
+    @property
+    def attributes_table(self) -> Tuple[List, List]:
+        """The ``OcxGlobalElement`` attribute values as a table ready for ``tabulate``.
+
+        Returns:
+            A tuple ``(headers, rows)`` with the same heading keys as ``attributes_to_dict``.
+            The table is computed once and reset when an attribute is added.
+
+        """
+        if self._attributes_table is None:
+            self._attributes_table = self._to_table(self._attributes)
+        return self._attributes_table
+
+    @property
+    def children_table(self) -> Tuple[List, List]:
+        """The ``OcxGlobalElement`` children values as a table ready for ``tabulate``.
+
+        Returns:
+            A tuple ``(headers, rows)`` with the same heading keys as ``children_to_dict``.
+            The table is computed once and reset when a child is added.
+
+        """
+        if self._children_table is None:
+            self._children_table = self._to_table(
+                sorted(self._children, key=lambda x: x.name)
+            )
+        return self._children_table
+
+    @staticmethod
+    def _to_table(items: List) -> Tuple[List, List]:
+        """Convert a list of dataclasses to a tuple of ``(headers, rows)``."""
+        rows = [list(item.to_dict().values()) for item in items]
+        headers = list(items[0].to_dict()) if items else []
+        return headers, rows
@@ -2,6 +2,7 @@
 
 import re
 from dataclasses import asdict
+from functools import lru_cache
 from typing import Dict, List, Union
 
 from lxml.etree import Element, ElementTextIterator
@@ -57,7 +58,7 @@ class SchemaHelper:
         if "ref" in attributes:
             schema_type = attributes["ref"]
         # The element may have complexContent
-        if len(LxmlElement.find_all_children_with_name(element, "complexContent")) > 0:
+        if LxmlElement.has_child_with_name(element, "complexContent"):
             # complexContent has either an extension or a restriction
             # extension
             base = LxmlElement.find_all_children_with_name_and_attribute(
@@ -72,29 +73,32 @@ class SchemaHelper:
             if len(base) > 0:
                 schema_type = base[0].get("base")
         # the element may be a simpleType
-        simple_type = LxmlElement.find_all_children_with_name(element, "simpleType")
-        if len(simple_type) > 0:
+        simple_type = LxmlElement.find_child_with_name(element, "simpleType")
+        if simple_type is not None:
             # simpleType may have either an extension or a restriction
             # extension
             base = LxmlElement.find_all_children_with_name_and_attribute(
-                simple_type[0], "extension", "base"
+                simple_type, "extension", "base"
             )
             if len(base) > 0:
                 schema_type = base[0].get("base")
             # restriction
             base = LxmlElement.find_all_children_with_name_and_attribute(
-                simple_type[0], "restriction", "base"
+                simple_type, "restriction", "base"
             )
             if len(base) > 0:
                 schema_type = base[0].get("base")
-        # the element may be a List
-        for item in LxmlElement.iter(element, "{*}list"):
-            type = item.get("itemType")
-            schema_type = f"List of type {type}"
-        # the element may be a restriction
-        for item in LxmlElement.iter(element, "{*}restriction"):
-            type = item.get("base")
-            schema_type = f"Restriction of type {type}"
+        # the element may be a List or a restriction. Walk the subtree once, the last restriction takes precedence
+        last_list = last_restriction = None
+        for item in LxmlElement.iter(element, "{*}list", "{*}restriction"):
+            if item.tag.rpartition("}")[2] == "list":
+                last_list = item
+            else:
+                last_restriction = item
+        if last_list is not None:
+            schema_type = f"List of type {last_list.get('itemType')}"
+        if last_restriction is not None:
+            schema_type = f"Restriction of type {last_restriction.get('base')}"
 
         # if schemaType is not None:
         #     # Add any missing prefix
@@ -108,6 +112,7 @@ class SchemaHelper:
         return schema_type
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def unique_tag(name: str, namespace: str) -> str:
         """A unique global tag from the element name and namespace
 
@@ -116,7 +121,8 @@ class SchemaHelper:
             namespace: The namespace
 
         Returns:
-            A unique element tag on the form ``{namespace}name``
+            A unique element tag on the form ``{namespace}name``. The same tag object is returned for
+            repeated calls, so the tags used as hash keys share one string with a cached hash.
 
         """
 
@@ -136,11 +142,11 @@ class SchemaHelper:
         """
         version = "Missing"
         # root.findall('.//{*}attribute[@name="schemaVersion"]'
-        element = LxmlElement.find_all_children_with_attribute_value(
+        element = LxmlElement.find_first_child_with_attribute_value(
             root, "attribute", "name", "schemaVersion"
         )
-        if len(element) > 0:
-            version = element[0].get("fixed")
+        if element is not None:
+            version = element.get("fixed")
         return version
 
     @staticmethod
@@ -156,7 +162,7 @@ class SchemaHelper:
 
         """
         schema_changes = []
-        changes = LxmlElement.find_all_children_with_name(root, "SchemaChange")
+        changes = LxmlElement.iter_children_with_name(root, "SchemaChange")
         for change in changes:
             # Retrieve the reason for change from the Description element
             description = LxmlElement.find_all_children_with_name(change, "Description")
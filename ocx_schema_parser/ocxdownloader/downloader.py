@@ -1,29 +1,107 @@
 #  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Union
+from urllib.request import urlopen
 
 from loguru import logger
 
 # Third part imports
+from xsdata.models.wsdl import Definitions
+from xsdata.models.xsd import Schema
 from xsdata.utils.downloader import Downloader
 
 
 # Module imports
 
+# Maximum number of concurrent schema downloads
+MAX_DOWNLOAD_WORKERS = 8
+
+
+def _read_uri(uri: str) -> bytes:
+    """Read the content of ``uri``."""
+    with urlopen(uri) as response:  # nosec
+        return response.read()
+
 
 class SchemaDownloader(Downloader):
     """Downloader specialisation class.
 
+    The schemas included by a schema are fetched concurrently before they are processed.
+
     Arguments:
         output: The location of the download folder relative to current directory
 
     Args:
         schema_folder: The path to the schema download folder
+        resolved_folder: The absolute path to the schema download folder, resolved once for logging
+        prefetched: The content of fetched schemas not yet processed with the uri as key
     """
 
     def __init__(self, output: Path):
         super().__init__(output)
         self.schema_folder = output
+        self.resolved_folder = output.resolve()
+        self.prefetched: Dict[str, bytes] = {}
+
+    def wget(self, uri: str, location: Optional[str] = None):
+        """Download handler for any uri input with circular protection.
+
+        Same as the super class method, but uses the content of ``uri`` if it is already fetched.
+
+        Arguments:
+            uri: the location of the schema to download. All referenced schemas will be collected.
+            location: The schema location of the uri as given in the referencing schema.
+        """
+        # Copy of xsdata 23.8 Downloader.wget, apart from reading the prefetched content.
+        # Check the copy against the super class method when upgrading xsdata.
+        if not (uri in self.downloaded or (location and location in self.downloaded)):
+            self.downloaded[uri] = None
+            self.downloaded[location] = None
+            self.adjust_base_path(uri)
+            logger.debug(f"Fetching {uri}")
+            input_stream = self.prefetched.pop(uri, None)
+            if input_stream is None:
+                input_stream = _read_uri(uri)
+            if uri.endswith("wsdl"):
+                self.parse_definitions(uri, input_stream)
+            else:
+                self.parse_schema(uri, input_stream)
+            self.write_file(uri, location, input_stream.decode())
+
+    def wget_included(self, definition: Union[Schema, Definitions]):
+        """Fetch all schemas included by ``definition`` concurrently, then process them in order.
+
+        Arguments:
+            definition: The schema or definitions holding the includes and imports.
+        """
+        included = [
+            (item.location, getattr(item, "schema_location", None))
+            for item in definition.included()
+            if item.location
+        ]
+        pending = list(
+            dict.fromkeys(
+                uri
+                for uri, location in included
+                if uri not in self.downloaded
+                and not (location and location in self.downloaded)
+                and uri not in self.prefetched
+            )
+        )
+        try:
+            if len(pending) > 1:
+                workers = min(len(pending), MAX_DOWNLOAD_WORKERS)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for uri, content in zip(pending, executor.map(_read_uri, pending)):
+                        self.prefetched[uri] = content
+            for uri, location in included:
+                self.wget(uri, location)
+        finally:
+            # Discard the content not used by wget: the schemas already downloaded through a nested include,
+            # or all of it if a download or parse failed
+            for uri in pending:
+                self.prefetched.pop(uri, None)
 
     def write_file(self, uri: str, location: Optional[str], content: str):
         """
@@ -39,7 +117,7 @@ class SchemaDownloader(Downloader):
         file_path = self.schema_folder / name
         file_path.write_text(content, encoding="utf-8")
         logger.debug(
-            f"Writing schema {file_path.resolve()} to folder {self.schema_folder.resolve()}"
+            f"Writing schema {self.resolved_folder / name} to folder {self.resolved_folder}"
         )
         # logger.debug(content)
         self.downloaded[uri] = file_path
@@ -1,7 +1,9 @@
 #  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
 """ocxparser module."""
+import os
 from collections import defaultdict
-from typing import Any, DefaultDict, Dict, Iterator, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, DefaultDict, Dict, Iterator, List, Optional, Tuple, Union
 
 import lxml
 
@@ -17,6 +19,19 @@ from ocx_schema_parser.helpers import SchemaHelper
 from ocx_schema_parser.xparse import LxmlElement, LxmlParser
 
 
+def _parse_xsd(file: str) -> Union[LxmlParser, None]:
+    """Parse the xsd file ``file`` into a new ``LxmlParser``. Safe to call from worker threads.
+
+    Returns:
+        The parser holding the parsed schema, None if the file could not be parsed.
+
+    """
+    parser = LxmlParser()
+    if parser.parse(file):
+        return parser
+    return None
+
+
 class OcxParser:
     """
     The OcxSchema provides functionality for parsing the OCX xsd schema and storing all the elements.
@@ -25,6 +40,7 @@ class OcxParser:
     Attributes:
         _schema_namespaces: All namespaces on the form (prefix, namespace) key-value pairs resulting from parsing all
                 schema files, `W3C <https://www.w3.org/TR/xml-names/#sec-namespaces>`_.
+        _namespace_prefixes: The inverse of ``_schema_namespaces``. The first prefix of a namespace wins.
         _is_parsed: True if a schema has been parsed, False otherwise
         _schema_version: The version of the parsed schema
        _schema_changes: A list of all schema changes described by the tag SchemaChange contained in the xsd file.
@@ -34,15 +50,19 @@ class OcxParser:
         _builtin_xs_types: W3C primitive data types.
             `www.w3.org <https://www.w3.org/TR/xmlschema-2/#built-in-primitive-datatypes>`_. Defined in ``config.py``
         _schema_ns: The schema target ns with the schema version as key
+        _schema_parser: The parser of the schema being processed
+        _elements_by_type: The results of ``get_element_from_type`` with the schema type as key
 
     """
 
     def __init__(self):
         # Default namespace map for the reserved prefix xml. See https://www.w3.org/TR/xml-names/#sec-namespaces
         self._schema_namespaces: Dict = {"xml": "http://www.w3.org/XML/1998/namespace"}
+        self._namespace_prefixes: Dict = {"http://www.w3.org/XML/1998/namespace": "xml"}
         self._target_ns: str = ""
         self._is_parsed: bool = False
         self._root: lxml.etree.Element = None
+        self._schema_parser: LxmlParser = None
         self._all_schema_elements: Dict = (
             {}
         )  # Hash table with tag as key schema_elements[tag] = lxml.etree.Element
@@ -60,6 +80,7 @@ class OcxParser:
         )  # Store the schema target ns with the schema version as key
         self._schema_enumerators: Dict = {}
         self._simple_types: List = []
+        self._elements_by_type: Dict = {}
 
     def process_xsd_from_file(self, file: str) -> bool:
         """Process the xsd with file name ``file``.
@@ -76,6 +97,40 @@ class OcxParser:
             return True
         return False
 
+    def process_xsd_files(
+        self, files: List[str], max_workers: Optional[int] = None
+    ) -> bool:
+        """Process the xsd files ``files``.
+
+        The files are parsed concurrently in a thread pool. The parsed schemas are then merged in the order
+        of ``files``. The namespaces of all the schemas are registered before any schema is processed,
+        so the result does not depend on the order in which the schemas import each other.
+
+        Args:
+            files: The file names of the xsd files.
+            max_workers: The maximum number of parsing threads. Defaults to one per file, limited by the CPU count.
+
+        Returns:
+            True if all files are processed, False otherwise.
+
+        """
+        files = list(files)
+        if len(files) == 0:
+            return False
+        workers = max_workers or min(len(files), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parsers = list(executor.map(_parse_xsd, files))
+        for file, parser in zip(files, parsers):
+            if parser is not None:
+                self._add_schema_namespaces(parser, file)
+        result = True
+        for file, parser in zip(files, parsers):
+            if parser is not None and self._register_schema(parser):
+                self._create_lookup_tables()
+            else:
+                result = False
+        return result
+
     def _set_target_ns(self, target_ns) -> None:
         """
 
@@ -119,20 +174,11 @@ class OcxParser:
             The namespace prefix
 
         """
-        nsprefix = list(iter(self._schema_namespaces))
-        nstags = list(iter(self._schema_namespaces.values()))
-        prefix = ""
         try:
-            index = nstags.index(namespace)
-            prefix = nsprefix[index]
-            if prefix is None:
-                nstags.pop(index)
-                nsprefix.pop(index)
-                index = nstags.index(namespace)
-                prefix = nsprefix.index(index)
-        except ValueError as e:
-            logger.error(f"{namespace} is not in the namespace list: {e}")
-        return prefix
+            return self._namespace_prefixes[namespace]
+        except KeyError:
+            logger.error(f"{namespace} is not in the namespace list")
+            return ""
 
     def _add_namespace(self, namespace: Dict) -> int:
         """Add new namespaces to the global namespace dict
@@ -142,6 +188,8 @@ class OcxParser:
 
         """
         ns_size = len(self._schema_namespaces)
+        # Work on a copy, the caller may hand over a cached namespace map
+        namespace = dict(namespace)
         # Check if any keys exists
         for prefix in self._schema_namespaces:
             if prefix in namespace:
@@ -154,6 +202,10 @@ class OcxParser:
                 )
                 del namespace[prefix]
         self._schema_namespaces = {**self._schema_namespaces, **namespace}
+        self._elements_by_type.clear()
+        self._namespace_prefixes = {}
+        for prefix, ns in self._schema_namespaces.items():
+            self._namespace_prefixes.setdefault(ns, prefix)
         return len(self._schema_namespaces) - ns_size
 
     def _parse_xsd_from_file(self, file: str) -> bool:
@@ -166,66 +218,73 @@ class OcxParser:
             True if parsed successfully, false otherwise
 
         """
-        parser = LxmlParser()
-        if result := parser.parse(file):
-            num_ns = self._add_namespace(parser.get_namespaces())
-            logger.debug(f'Added {num_ns} new namespaces for schema "{file}"')
-            target_ns = parser.get_target_namespace()
-            if target_ns not in self._schema_namespaces.values():
-                logger.error(
-                    f'The target _namespace "{target_ns}" is not registered in '
-                    f"the _namespace listing {self._schema_namespaces}"
-                )
-                return False
-            self._set_target_ns(target_ns)
-            self._root = parser.get_root()
-            # Retrieve the OCX schema version
-            version = SchemaHelper.get_schema_version(self._root)
-            if version != "Missing":
-                self._schema_version = version
-                self._schema_ns[version] = target_ns
-        return result
+        parser = _parse_xsd(file)
+        if parser is None:
+            return False
+        self._add_schema_namespaces(parser, file)
+        return self._register_schema(parser)
+
+    def _add_schema_namespaces(self, parser: LxmlParser, file: str) -> None:
+        """Add the namespaces of a parsed schema to the global namespace dict.
+
+        Args:
+            parser: The parser holding the parsed schema.
+            file: The schema file name.
+
+        """
+        num_ns = self._add_namespace(parser.get_namespaces())
+        logger.debug(f'Added {num_ns} new namespaces for schema "{file}"')
+
+    def _register_schema(self, parser: LxmlParser) -> bool:
+        """Make a parsed schema the current schema to be processed.
+
+        Args:
+            parser: The parser holding the parsed schema.
+
+        Returns:
+            True if the schema target namespace is registered, False otherwise
+
+        """
+        target_ns = parser.get_target_namespace()
+        if target_ns not in self._schema_namespaces.values():
+            logger.error(
+                f'The target _namespace "{target_ns}" is not registered in '
+                f"the _namespace listing {self._schema_namespaces}"
+            )
+            return False
+        self._set_target_ns(target_ns)
+        self._schema_parser = parser
+        self._root = parser.get_root()
+        # Retrieve the OCX schema version
+        version = SchemaHelper.get_schema_version(self._root)
+        if version != "Missing":
+            self._schema_version = version
+            self._schema_ns[version] = target_ns
+        return True
 
     def _create_lookup_tables(self) -> None:
         """Create the global lookup tables of Schema data classes with the tag as key."""
 
         root = self._root
-        # Add all global elements
-        type = "element"
-        self._schema_types.append(type)
-        for e in LxmlElement.find_all_children_with_name_and_attribute(
-            root, type, "name"
-        ):
-            self._add_element_to_lookup_table(e, self.get_target_namespace())
-        # Add all complex elements
-        type = "complexType"
-        self._schema_types.append(type)
-        for e in LxmlElement.find_all_children_with_name_and_attribute(
-            root, type, "name"
-        ):
-            self._add_element_to_lookup_table(e, self.get_target_namespace())
-        # Add all simple types
-        type = "simpleType"
-        self._schema_types.append(type)
-        for e in LxmlElement.find_all_children_with_name_and_attribute(
-            root, type, "name"
-        ):
-            self._add_element_to_lookup_table(e, self.get_target_namespace())
-        # Add all attributeGroups
-        type = "attributeGroup"
-        self._schema_types.append(type)
-        for e in LxmlElement.find_all_children_with_name_and_attribute(
-            root, type, "name"
-        ):
-            self._add_element_to_lookup_table(e, self.get_target_namespace())
+        # Collect the named elements, complex types, simple types and attribute groups in a single tree walk,
+        # then add them type by type in document order
+        types = ["element", "complexType", "simpleType", "attributeGroup"]
+        named = {type: [] for type in types}
+        for e in LxmlElement.iter(root, *(f"{{*}}{type}" for type in types)):
+            if e.get("name") is not None:
+                named[e.tag.rpartition("}")[2]].append(e)
+        for type in types:
+            self._schema_types.append(type)
+            for e in named[type]:
+                self._add_element_to_lookup_table(e, self.get_target_namespace())
         # Add all global attributes (these are refs)
         glob_attr = LxmlElement.find_all_children_with_name_and_attribute(
             root, "attribute", "ref"
         )
         names = {LxmlElement.get_name(a) for a in glob_attr}
         for name in names:
-            element = LxmlElement.find_all_children_with_attribute_value(
-                root, "attribute", "name", name
+            element = self._schema_parser.find_all_with_attribute_value(
+                "attribute", "name", name
             )
             if len(element) == 1:
                 self._add_element_to_lookup_table(
@@ -270,6 +329,7 @@ class OcxParser:
 
         """
         self._all_schema_elements[tag] = element
+        self._elements_by_type.clear()
 
     def _add_schema_type(self, schema_type: str, tag: str):
         """Add a new schema type to the hash table.
@@ -429,6 +489,14 @@ class OcxParser:
             A tuple of the element unique tag and the element (tag, Element)
 
         """
+        result = self._elements_by_type.get(schema_type)
+        if result is None:
+            result = self._element_from_type(schema_type)
+            self._elements_by_type[schema_type] = result
+        return result
+
+    def _element_from_type(self, schema_type: str) -> Tuple[Any, Any]:
+        """Look up the schema element with the key ``schema_type`` in the hash tables."""
         name = LxmlElement.strip_namespace_prefix(schema_type)
         if LxmlElement.namespace_prefix(schema_type) in self._schema_namespaces:
             namespace = self._schema_namespaces[
@@ -458,21 +526,20 @@ class OcxParser:
             The schema summary content dataclasses
 
         """
+        # Split each tag once into namespace and local name
+        local_names = {}
+        for type, tags in self._all_types.items():
+            by_namespace = defaultdict(list)
+            for tag in tags:
+                qn = QName(tag)
+                by_namespace[qn.namespace].append(qn.localname)
+            local_names[type] = by_namespace
         summary = {}
         for prefix, namespace in self._schema_namespaces.items():
             content = {"Version": [self.get_schema_version()], "Prefix": [prefix]}
-            for type in self._all_types:
-                items = list(
-                    filter(
-                        lambda x: QName(x).namespace == namespace, self._all_types[type]
-                    )
-                )
-                if short:
-                    content[type] = [
-                        len(list(map(lambda name: QName(name).localname, items)))
-                    ]
-                else:
-                    content[type] = list(map(lambda name: QName(name).localname, items))
+            for type, by_namespace in local_names.items():
+                names = by_namespace.get(namespace, [])
+                content[type] = [len(names)] if short else list(names)
             summary[namespace] = content
         return summary
 
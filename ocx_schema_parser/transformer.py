@@ -2,8 +2,9 @@
 """Schema transformer"""
 
 # System imports
-
+import sys
 from collections import defaultdict
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Iterator, List, Union
 
@@ -39,7 +40,7 @@ def resolve_source(source: str, recursive: bool) -> Iterator[str]:
         match = "**/*" if recursive else "*"
         if path.is_dir():
             for ext in ["wsdl", "xsd", "dtd", "xml", "json"]:
-                yield from (x.as_uri() for x in path.glob(f"{match}.{ext}"))
+                yield from (x.as_uri() for x in sorted(path.glob(f"{match}.{ext}")))
         else:  # is file
             yield path.as_uri()
 
@@ -75,11 +76,6 @@ def download_schema_from_url(url: str, schema_folder: Path) -> List:
     return uris
 
 
-def filter_ocx(name: str, prefix: str, ocx: OcxGlobalElement) -> bool:
-    """Filter function for looking up an ocx instance by name and prefix."""
-    return name == ocx.get_name() and prefix == ocx.get_prefix()
-
-
 class Transformer:
     """The OCX transformer class.
 
@@ -89,6 +85,10 @@ class Transformer:
         _ocx_global_elements: Hash table as key-value pairs `(tag, OcxSchemaElement)` for all parsed schema elements
         _schema_enumerators: All schema enumerators
         _simple_types: All schema simple type elements
+        _ocx_elements_by_name: Look-up table as key-value pairs `(name, OcxGlobalElement)`
+        _ocx_elements_by_type: Look-up table as key-value pairs `((prefix, name), OcxGlobalElement)`
+        _simple_types_by_name: Look-up table as key-value pairs `(name, SchemaAttribute)` for the simple types
+        _global_attributes_by_name: Look-up table as key-value pairs `(name, SchemaAttribute)` for the global attributes
         -is_transformed: True if schema classes are transformed, False otherwise
     """
 
@@ -100,6 +100,10 @@ class Transformer:
         self._schema_enumerators: Dict = {}
         self._simple_types: List[SchemaAttribute] = []
         self._global_attributes: List[SchemaAttribute] = []
+        self._ocx_elements_by_name: Dict = {}
+        self._ocx_elements_by_type: Dict = {}
+        self._simple_types_by_name: Dict = {}
+        self._global_attributes_by_name: Dict = {}
         self._is_transformed: bool = False
 
     def transform_schema_from_url(self, url: str, folder: Path) -> bool:
@@ -139,9 +143,7 @@ class Transformer:
             OCX instance with ``name``
 
         """
-        items = filter(lambda item: item.get_name() == name, self.get_ocx_elements())
-        for ocx in items:
-            return ocx
+        return self._ocx_elements_by_name.get(name)
 
     def get_ocx_element_from_type(
         self, schema_type: str
@@ -155,15 +157,9 @@ class Transformer:
             The ``OcxGlobalElement`` instance
 
         """
-        object = None
         name = LxmlElement.strip_namespace_prefix(schema_type)
         prefix = LxmlElement.namespace_prefix(schema_type)
-        result = filter(
-            lambda ocx: filter_ocx(name, prefix, ocx), self.get_ocx_elements()
-        )
-        for item in result:
-            object = item
-        return object
+        return self._ocx_elements_by_type.get((prefix, name))
 
     def ocx_iterator(self) -> Iterator:
         """Return an iterator of the OCX elements."""
@@ -181,6 +177,38 @@ class Transformer:
         """Return all global simpleType instances."""
         return self._simple_types
 
+    @cached_property
+    def enumerators_as_dict(self) -> Dict:
+        """The ``to_dict`` output of all enumerators with the enumerator name as key, built once per transform."""
+        return {name: enum.to_dict() for name, enum in self._schema_enumerators.items()}
+
+    @cached_property
+    def global_attributes_as_dict(self) -> Dict:
+        """The ``to_dict`` output of all global attributes with the attribute name as key, built once per transform."""
+        return {
+            attribute.name: attribute.to_dict() for attribute in self._global_attributes
+        }
+
+    @cached_property
+    def simple_types_as_dict(self) -> Dict:
+        """The ``to_dict`` output of all simple types with the type name as key, built once per transform."""
+        return {
+            simple_type.name: simple_type.to_dict()
+            for simple_type in self._simple_types
+        }
+
+    def get_enumerator_with_name(self, name: str) -> Union[OcxEnumerator, None]:
+        """Return the enumerator with name ``name``, None if not found."""
+        return self._schema_enumerators.get(name)
+
+    def get_simple_type_with_name(self, name: str) -> Union[SchemaAttribute, None]:
+        """Return the global simpleType with name ``name``, None if not found."""
+        return self._simple_types_by_name.get(name)
+
+    def get_global_attribute_with_name(self, name: str) -> Union[SchemaAttribute, None]:
+        """Return the global attribute with name ``name``, None if not found."""
+        return self._global_attributes_by_name.get(name)
+
     def get_enumerator_types(self) -> Dict:
         """Return the schema enumerator types.
         Returns: All enumerator types
@@ -215,13 +243,11 @@ class Transformer:
         Args:
             location: The folder containing the xsd schemas.
         """
-        files = resolve_source(str(location.resolve()), True)
-        counter = 0
+        # resolve_source resolves the path
+        files = list(resolve_source(str(location), True))
         # parse all schemas
-        for file in files:
-            self.parser.process_xsd_from_file(file)
-            counter = +1
-        return counter > 0
+        self.parser.process_xsd_files(files)
+        return len(files) > 0
 
     def _add_global_ocx_element(self, tag: str, element: OcxGlobalElement):
         """Add a global OCX element to the hash table
@@ -275,6 +301,13 @@ class Transformer:
 
     def _transform_objects(self) -> None:
         """Transform all parsed elements to python objects"""
+        # Drop the dict views of a previous transform
+        for view in (
+            "enumerators_as_dict",
+            "global_attributes_as_dict",
+            "simple_types_as_dict",
+        ):
+            self.__dict__.pop(view, None)
         # All schema elements of type element
         elements = self.parser.get_schema_element_types()
         for tag in elements:
@@ -337,8 +370,32 @@ class Transformer:
                 description=annotation,
             )
             self._add_global_attribute(attribute)
+        self._create_name_lookup_tables()
         return
 
+    def _create_name_lookup_tables(self) -> None:
+        """Index the transformed objects by name. The first object with a given name wins.
+
+        The global elements are also indexed by type, where the last element with a given prefix and name wins.
+        """
+        # Drop the indexes of a previous transform
+        self._ocx_elements_by_name.clear()
+        self._ocx_elements_by_type.clear()
+        self._simple_types_by_name.clear()
+        self._global_attributes_by_name.clear()
+        for ocx in self._ocx_global_elements.values():
+            name = sys.intern(ocx.get_name())
+            self._ocx_elements_by_name.setdefault(name, ocx)
+            self._ocx_elements_by_type[(ocx.get_prefix(), name)] = ocx
+        for simple_type in self._simple_types:
+            self._simple_types_by_name.setdefault(
+                sys.intern(simple_type.name), simple_type
+            )
+        for attribute in self._global_attributes:
+            self._global_attributes_by_name.setdefault(
+                sys.intern(attribute.name), attribute
+            )
+
     def _add_schema_enumerator(self, enum: OcxEnumerator):
         """Add a schema enumerator type.
 
@@ -367,24 +424,30 @@ class Transformer:
 
         # Process all xs:attribute elements including all supertypes
         ns = ocx.get_namespace()
-        attributes = LxmlElement.find_attributes(ocx.get_schema_element())
+        attributes = LxmlElement.iter_children_with_name(
+            ocx.get_schema_element(), "attribute"
+        )
         for a in attributes:
             ocx.add_attribute(self._process_attribute(a, ns))
         # Iterate over parents
         parents = ocx.get_parents()
         for t in parents:
-            attributes = LxmlElement.find_attributes(parents[t])
+            attributes = LxmlElement.iter_children_with_name(parents[t], "attribute")
             for a in attributes:
                 ocx.add_attribute(self._process_attribute(a, ns))
         # Process all xs:attributeGroup elements including all supertypes attributeGroups
-        groups = LxmlElement.find_attribute_groups(ocx.get_schema_element())
+        groups = LxmlElement.iter_children_with_name(
+            ocx.get_schema_element(), "attributeGroup"
+        )
         for group in groups:
             # Get the reference
             ref = LxmlElement.get_reference(group)
             if ref is not None:
                 tag, at_group = self.parser.get_element_from_type(ref)
                 if at_group is not None:
-                    attributes = LxmlElement.find_attributes(at_group)
+                    attributes = LxmlElement.iter_children_with_name(
+                        at_group, "attribute"
+                    )
                     for a in attributes:
                         ocx.add_attribute(self._process_attribute(a, ns))
                 else:
@@ -394,14 +457,16 @@ class Transformer:
         # Iterate over parents
         parents = ocx.get_parents()
         for t in parents:
-            groups = LxmlElement.find_attribute_groups(parents[t])
+            groups = LxmlElement.iter_children_with_name(parents[t], "attributeGroup")
             for group in groups:
                 # Get the reference
                 ref = LxmlElement.get_reference(group)
                 if ref is not None:
                     tag, at_group = self.parser.get_element_from_type(ref)
                     if at_group is not None:
-                        attributes = LxmlElement.find_attributes(at_group)
+                        attributes = LxmlElement.iter_children_with_name(
+                            at_group, "attribute"
+                        )
                         for a in attributes:
                             ocx.add_attribute(self._process_attribute(a, ns))
                     else:
@@ -420,7 +485,7 @@ class Transformer:
 
         # Process all xs:element elements including all supertypes
         target_ns = ocx.get_namespace()
-        elements = LxmlElement.find_all_children_with_name(
+        elements = LxmlElement.iter_children_with_name(
             ocx.get_schema_element(), "element"
         )
         for e in elements:
@@ -446,7 +511,7 @@ class Transformer:
         # Iterate over parents
         parents = ocx.get_parents()
         for t in parents:
-            elements = LxmlElement.find_all_children_with_name(parents[t], "element")
+            elements = LxmlElement.iter_children_with_name(parents[t], "element")
             for e in elements:
                 name = f"{self.parser.get_prefix_from_namespace(target_ns)}:{LxmlElement.get_name(e)}"
                 prefix = self.parser.get_prefix_from_namespace(target_ns)
@@ -530,8 +595,8 @@ class Transformer:
         name = LxmlElement.get_name(xs_element)
         type = SchemaHelper.get_type(xs_element)
         annotation = LxmlElement.get_element_text(xs_element)
-        cardinality = LxmlElement.cardinality_string(xs_element)
         lower, upper = LxmlElement.cardinality(xs_element)
+        cardinality = LxmlElement.format_cardinality(lower, upper)
         choice = LxmlElement.is_choice(xs_element)
         if lower == 0:
             use = "opt."
@@ -1,14 +1,51 @@
 #  Copyright (c) 2022-2023. OCX Consortium https://3docx.org. See the LICENSE
 
 # Sys imports
-import re
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Union
 
 # Third party imports
 from loguru import logger
 from lxml import etree
 from lxml.etree import Element, ElementTextIterator, QName
 
+# The xsd vocabulary searched for by the parser, tagged with the wildcard namespace
+_WILDCARD_TAGS = {
+    name: f"{{*}}{name}"
+    for name in (
+        "import",
+        "element",
+        "complexType",
+        "simpleType",
+        "attribute",
+        "attributeGroup",
+        "enumeration",
+        "annotation",
+        "documentation",
+        "complexContent",
+        "extension",
+        "restriction",
+        "list",
+        "sequence",
+        "choice",
+        "assert",
+    )
+}
+
+
+def _tag(name: str, namespace: str) -> str:
+    """The ``{namespace}name`` tag, using the prebuilt tags for the xsd vocabulary."""
+    if namespace == "*" and name in _WILDCARD_TAGS:
+        return _WILDCARD_TAGS[name]
+    return f"{{{namespace}}}{name}"
+
+
+# The use values of a mandatory attribute
+_REQUIRED_USE = frozenset(("req", "required"))
+
+# Translation table deleting the special characters from a text
+_SPECIAL_CHARACTERS = str.maketrans("", "", "\n\t\r")
+
 
 class LxmlElement:
     """A wrapper class for the lxml etree.Element class main functions."""
@@ -94,7 +131,8 @@ class LxmlElement:
             A List of all children of 'element' excluding the parent itself.
 
         """
-        return element.findall(".//")
+        # Elements only, comments and processing instructions are skipped as with findall(".//")
+        return list(element.iterdescendants(etree.Element))
 
     @staticmethod
     def get_xml_attrib(element: Element) -> Dict:
@@ -166,12 +204,8 @@ class LxmlElement:
             The element use as a string, either ``required`` or ``optional``
 
         """
-        use = element.get("use")
-        if use is None:
-            return "opt."
-        if use == "required":
-            use = "req."
-        return use
+        use = element.get("use", "opt.")
+        return "req." if use == "required" else use
 
     @staticmethod
     def get_reference(element: Element) -> Any:
@@ -236,7 +270,20 @@ class LxmlElement:
     @classmethod
     def cardinality_string(cls, element) -> str:
         """Return the element cardinality formatted string."""
-        lower, upper = cls.cardinality(element)
+        return cls.format_cardinality(*cls.cardinality(element))
+
+    @staticmethod
+    def format_cardinality(lower: int, upper: Any) -> str:
+        """Format the cardinality bounds as a string.
+
+        Args:
+            lower: The lower bound
+            upper: The upper bound, ``unbounded`` if there is no upper bound
+
+        Returns:
+            The cardinality formatted as ``[lower, upper]``
+
+        """
         if upper == "unbounded":
             upper = "\u221E"  # UTF-8 Infinity symbol
         return f"[{lower}, {upper}]"
@@ -254,30 +301,18 @@ class LxmlElement:
 
         """
 
-        attributes = LxmlElement.get_xml_attrib(element)
-        if "minOccurs" in attributes:
-            lower = int(attributes["minOccurs"])
+        lower = element.get("minOccurs")
+        if lower is None:
+            # Without minOccurs, only an explicit non-required use makes the element optional
+            lower = 1 if element.get("use", "required") in _REQUIRED_USE else 0
         else:
-            use = attributes.get("use")
-            if use is not None:
-                if use == "req" or use == "required":
-                    lower = 1
-                else:
-                    lower = 0
-            else:
-                lower = 1
-        if "maxOccurs" in attributes:
-            upper = attributes["maxOccurs"]
-        else:
-            upper = 1
+            lower = int(lower)
+        upper = element.get("maxOccurs", 1)
         # Find the closest xs:sequence or xs:choice ancestor which overrules mandatory use
-        for item in element.iterancestors("{*}sequence", "{*}choice"):
-            attributes = item.attrib
-            if "minOccurs" in attributes:
-                lower = int(attributes["minOccurs"])
-            if "maxOccurs" in attributes:
-                upper = attributes["maxOccurs"]
-            break
+        item = next(element.iterancestors("{*}sequence", "{*}choice"), None)
+        if item is not None:
+            lower = int(item.get("minOccurs", lower))
+            upper = item.get("maxOccurs", upper)
         return lower, upper
 
     @staticmethod
@@ -292,14 +327,9 @@ class LxmlElement:
             True if the element node is a choice, false otherwise
 
         """
-        choice = False
         # Find the closest sequence or choice ancestor which overrules mandatory use
-        for item in element.iterancestors("{*}sequence", "{*}choice"):
-            qn = QName(item)
-            if qn.localname == "choice":
-                choice = True
-            break
-        return choice
+        item = next(element.iterancestors("{*}sequence", "{*}choice"), None)
+        return item is not None and item.tag.rpartition("}")[2] == "choice"
 
     @staticmethod
     def is_substitution_group(element) -> bool:
@@ -313,11 +343,7 @@ class LxmlElement:
             True if the element is a  substitutionGroup, false otherwise
 
         """
-        attributes = LxmlElement.get_xml_attrib(element)
-        if "substitutionGroup" in attributes:
-            return True
-        else:
-            return False
+        return element.get("substitutionGroup") is not None
 
     @staticmethod
     def is_abstract(element) -> bool:
@@ -331,11 +357,7 @@ class LxmlElement:
             True if the element abstract, false otherwise
 
         """
-        attributes = LxmlElement.get_xml_attrib(element)
-        if "abstract" in attributes:
-            return True
-        else:
-            return False
+        return element.get("abstract") is not None
 
     @staticmethod
     def get_substitution_group(element: Element) -> str:
@@ -348,8 +370,7 @@ class LxmlElement:
             name of substitutionGroup, None if no substitutionGroup
 
         """
-        attributes = LxmlElement.get_xml_attrib(element)
-        return attributes.get("substitutionGroup")
+        return element.get("substitutionGroup")
 
     @staticmethod
     def get_restriction(element: Element) -> str:
@@ -379,13 +400,10 @@ class LxmlElement:
             The element text stripped of any special characters
 
         """
-        text = ""
-        description = ""
-        for text in ElementTextIterator(element, with_tail=False):
-            description = description + text
-            break
-        text = re.sub("[\n\t\r]", "", description)  # Strip off special characters
-        return text
+        description = next(ElementTextIterator(element, with_tail=False), "")
+        return description.translate(
+            _SPECIAL_CHARACTERS
+        )  # Strip off special characters
 
     @staticmethod
     def get_namespace(element: Element) -> str:
@@ -449,8 +467,26 @@ class LxmlElement:
             A list of elements. Empty list if no children can be found
 
         """
-        xpath = f".//{LxmlElement.namespaces_decorate(namespace)}{child_name}"
-        return element.findall(xpath)
+        return list(LxmlElement.iter_children_with_name(element, child_name, namespace))
+
+    @staticmethod
+    def iter_children_with_name(
+        element: Element, child_name: str, namespace: str = "*"
+    ) -> Iterator[Element]:
+        """Iterate over the XML element's children with  name ``child_name``, in document order.
+
+        The lazy version of ``find_all_children_with_name`` for callers iterating once over the result.
+
+        Args:
+            element: The XML parent node to search from
+            child_name: The name of the child
+            namespace: The search namespace. Default is the wildcard ``*`` matching any namespace
+
+        Returns:
+            An iterator over the children
+
+        """
+        return element.iterdescendants(_tag(child_name, namespace))
 
     @staticmethod
     def find_child_with_name(
@@ -467,8 +503,7 @@ class LxmlElement:
             The child element as etree.Element. None if no child can be found
 
         """
-        xpath = f".//{LxmlElement.namespaces_decorate(namespace)}{child_name}"
-        return element.find(xpath)
+        return next(element.iterdescendants(_tag(child_name, namespace)), None)
 
     @staticmethod
     def find_attributes(element: Element, namespace: str = "*") -> List[Element]:
@@ -483,8 +518,9 @@ class LxmlElement:
             The list of the xs:attribute type found
 
         """
-        xpath = f".//{LxmlElement.namespaces_decorate(namespace)}attribute"
-        return element.findall(xpath)
+        return list(
+            LxmlElement.iter_children_with_name(element, "attribute", namespace)
+        )
 
     @staticmethod
     def find_attribute_groups(element: Element, namespace: str = "*") -> List[Element]:
@@ -498,8 +534,9 @@ class LxmlElement:
             Attribute groups
 
         """
-        xpath = f".//{LxmlElement.namespaces_decorate(namespace)}attributeGroup"
-        return element.findall(xpath)
+        return list(
+            LxmlElement.iter_children_with_name(element, "attributeGroup", namespace)
+        )
 
     @staticmethod
     def has_child_with_name(
@@ -516,8 +553,9 @@ class LxmlElement:
             True if the element has a child with name ``child_name`` False otherwise
 
         """
-        xpath = f".//{LxmlElement.namespaces_decorate(namespace)}{child_name}"
-        return len(element.findall(xpath)) > 0
+        return (
+            LxmlElement.find_child_with_name(element, child_name, namespace) is not None
+        )
 
     @staticmethod
     def find_all_children_with_attribute_value(
@@ -541,8 +579,43 @@ class LxmlElement:
             Empty list if no children can be found
 
         """
-        xpath = f'.//{LxmlElement.namespaces_decorate(namespace)}{name}[@{attrib_name}="{attrib_value}"]'
-        return element.findall(xpath)
+        return [
+            child
+            for child in element.iterdescendants(_tag(name, namespace))
+            if child.get(attrib_name) == attrib_value
+        ]
+
+    @staticmethod
+    def find_first_child_with_attribute_value(
+        element: Element,
+        name: str,
+        attrib_name: str,
+        attrib_value: str,
+        namespace: str = "*",
+    ) -> Union[Element, None]:
+        """Find the first child ``name`` with the attribute ``attrib_name`` having the value ``attrib_value``.
+
+        The search stops at the first match.
+
+        Args:
+            element: The XML parent node to search from
+            name: The name of the element with attrib_name and attrib_value
+            attrib_name: The name of the attribute
+            attrib_value: The value of the attribute
+            namespace: The search namespace. Default is the wildcard ``*`` matching any namespace
+
+        Returns:
+            The first child in document order. None if no child can be found
+
+        """
+        return next(
+            (
+                child
+                for child in element.iterdescendants(_tag(name, namespace))
+                if child.get(attrib_name) == attrib_value
+            ),
+            None,
+        )
 
     @staticmethod
     def find_all_children_with_name_and_attribute(
@@ -562,8 +635,11 @@ class LxmlElement:
             An empty list if no children can be found
 
         """
-        xpath = f".//{LxmlElement.namespaces_decorate(namespace)}{child_name}[@{attrib_name}]"
-        return element.findall(xpath)
+        return [
+            child
+            for child in element.iterdescendants(_tag(child_name, namespace))
+            if child.get(attrib_name) is not None
+        ]
 
     @staticmethod
     # Finding the assertion in the code.
@@ -579,17 +655,14 @@ class LxmlElement:
             None if no assertion tag is found
 
         """
-        test = None
-        # Assertions
-        xpath = f'.//{LxmlElement.namespaces_decorate(namespace)}{"assert"}'
-        asserts = element.findall(xpath)
-        if len(asserts) > 0:
-            attrib = asserts[0].attrib
-            if "test" in attrib:
-                test = attrib["test"]
-        return test
+        # Only the first assertion is used
+        assertion = LxmlElement.find_child_with_name(element, "assert", namespace)
+        if assertion is None:
+            return None
+        return assertion.get("test")
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def namespace_prefix(element: str) -> Union[str, None]:
         """Returns the namespace prefix of an element if any
 
@@ -602,11 +675,8 @@ class LxmlElement:
             The element prefix string or None if no prefix
 
         """
-        i = element.find(":")
-        if not i == -1:
-            element = element[0:i]
-            return element
-        return None
+        prefix, separator, _ = element.partition(":")
+        return prefix if separator else None
 
     @staticmethod
     def replace_ns_tag_with_ns_prefix(element: str, namespaces: Dict) -> str:
@@ -655,6 +725,7 @@ class LxmlElement:
         return "{" + ns + "}"
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def strip_namespace_prefix(element: str) -> str:
         """Returns the element name without the namespace prefix
 
@@ -665,12 +736,11 @@ class LxmlElement:
             The element without namespace prefix
 
         """
-        i = element.find(":")
-        if not i == -1:
-            element = element[i + 1 : len(element)]
-        return element
+        _, separator, name = element.partition(":")
+        return name if separator else element
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def strip_namespace_tag(element: str) -> str:
         """Returns the element name without the namespace tag
 
@@ -681,7 +751,5 @@ class LxmlElement:
             The element without namespace tag
 
         """
-        i = element.find("}")
-        if not i == -1:
-            element = element[i + 1 : len(element)]
-        return element
+        _, separator, name = element.partition("}")
+        return name if separator else element
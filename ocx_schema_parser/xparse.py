@@ -1,7 +1,10 @@
 #  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
 """xparse module."""
 # System imports
-from typing import Dict
+import threading
+from collections import Counter, defaultdict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 # Third party imports
 from loguru import logger
@@ -12,23 +15,115 @@ from lxml.etree import Element, XMLSyntaxError
 from .xelement import LxmlElement
 
 
+# lxml parsers are reusable but must not be shared between threads
+_thread_parsers = threading.local()
+
+
+def _xml_parser(store_ids: bool) -> etree.XMLParser:
+    """The parser of the current thread, created once for each ``store_ids`` setting."""
+    parsers = getattr(_thread_parsers, "parsers", None)
+    if parsers is None:
+        parsers = _thread_parsers.parsers = {}
+    parser = parsers.get(store_ids)
+    if parser is None:
+        parser = parsers[store_ids] = etree.XMLParser(
+            remove_comments=False,
+            remove_blank_text=True,
+            ns_clean=True,
+            collect_ids=store_ids,
+            resolve_entities=False,
+            huge_tree=True,
+        )
+    return parser
+
+
+class _StructuralTarget:
+    """Parser target building the DOM without the ``annotation`` subtrees.
+
+    The parser option ``remove_blank_text`` does not apply to a parser target,
+    the whitespace-only text is therefore dropped here.
+
+    Attributes:
+        _builder: The tree builder receiving the structural events
+        _skip_depth: The element depth inside the annotation being skipped, 0 if outside
+        _text: The text chunks received since the last start or end event
+
+    """
+
+    def __init__(self):
+        self._builder = etree.TreeBuilder()
+        self._skip_depth = 0
+        self._text = []
+
+    def _flush(self):
+        text = "".join(self._text)
+        self._text.clear()
+        if text.strip():
+            self._builder.data(text)
+
+    def start(self, tag, attrib, nsmap=None):
+        if self._skip_depth > 0 or tag.endswith("}annotation"):
+            self._skip_depth += 1
+            return
+        self._flush()
+        self._builder.start(tag, attrib, nsmap)
+
+    def end(self, tag):
+        if self._skip_depth > 0:
+            self._skip_depth -= 1
+            return
+        self._flush()
+        self._builder.end(tag)
+
+    def data(self, data):
+        if self._skip_depth == 0:
+            self._text.append(data)
+
+    def close(self) -> Element:
+        self._flush()
+        return self._builder.close()
+
+
 class LxmlParser:
     """A wrapper of the lxml etree document tree and parser.
 
     Attributes:
         _tree : The ``lxml.etree`` DOM
+        _root: The root node of the DOM
+        _docinfo: The document information, read once after parsing
+        _namespaces: The namespaces defined on the root node
+        _prefixes: The inverse namespace map of (namespace, prefix) pairs. The first prefix of a namespace wins
+        _referenced_files: The xs:import locations with the namespace as key, None until first requested
+        _attribute_index: The elements below the root indexed by attribute value, with (name, attribute name) as key
+        _target_namespace: The target namespace of the schema
+        _evaluator: The XPath evaluator bound to the document, created on the first query
+        _tag_counts: The number of elements per local name, None until first requested
 
     """
 
     def __init__(self):
         self._tree: Element = None
-
-    def parse(self, file: str, store_ids: bool = False) -> bool:
+        self._root: Element = None
+        self._docinfo: Dict = {}
+        self._namespaces: Mapping = MappingProxyType({})
+        self._prefixes: Mapping = MappingProxyType({})
+        self._referenced_files: Union[Dict, None] = None
+        self._attribute_index: Dict = {}
+        self._target_namespace: Optional[str] = None
+        self._evaluator: Union[etree.XPathDocumentEvaluator, None] = None
+        self._tag_counts: Union[Counter, None] = None
+
+    def parse(
+        self, file: str, store_ids: bool = False, skip_annotations: bool = False
+    ) -> bool:
         """Parses an XML file.
 
         Args:
             file: The file name of the xml document to be parsed. The parser can only parse from a local file.
             store_ids: If set to True, the parser will create a hash table of the xml IDs
+            skip_annotations: If set to True, the ``annotation`` subtrees and the comments are left out of the DOM.
+                Use it when only the schema structure is needed. Apart from the URL, the document information
+                is then the one of the rebuilt tree, not of the file.
 
         Returns:
             The return value. True for success, False otherwise.
@@ -37,13 +132,19 @@ class LxmlParser:
         # Parsing the XML file.
         parsed = False
         try:
-            my_parser = etree.XMLParser(
-                remove_comments=False,
-                remove_blank_text=True,
-                ns_clean=True,
-                collect_ids=store_ids,
-            )
-            self._tree = etree.parse(file, parser=my_parser)
+            if skip_annotations:
+                my_parser = etree.XMLParser(
+                    target=_StructuralTarget(),
+                    remove_blank_text=True,
+                    ns_clean=True,
+                    resolve_entities=False,
+                    huge_tree=True,
+                )
+                self._tree = etree.ElementTree(etree.parse(file, parser=my_parser))
+                self._tree.docinfo.URL = str(file)
+            else:
+                self._tree = etree.parse(file, parser=_xml_parser(store_ids))
+            self._cache_document()
             parsed = True
         except XMLSyntaxError as e:
             logger.error(e)
@@ -51,6 +152,29 @@ class LxmlParser:
             logger.error("Failed to open file %s" % file, exc_info=True)
         return parsed
 
+    def _cache_document(self):
+        """Read the root node and the document information once after a successful parse."""
+        self._root = self._tree.getroot()
+        docinfo = self._tree.docinfo
+        self._docinfo = {
+            "public_id": docinfo.public_id,
+            "url": docinfo.URL,
+            "encoding": docinfo.encoding,
+            "root_name": docinfo.root_name,
+            "system_url": docinfo.system_url,
+            "xml_version": docinfo.xml_version,
+        }
+        self._namespaces = MappingProxyType(dict(self._root.nsmap))
+        prefixes = {}
+        for prefix, namespace in self._namespaces.items():
+            prefixes.setdefault(namespace, prefix)
+        self._prefixes = MappingProxyType(prefixes)
+        self._referenced_files = None
+        self._attribute_index = {}
+        self._target_namespace = self._root.get("targetNamespace")
+        self._evaluator = None
+        self._tag_counts = None
+
     def get_root(self) -> Element:
         """The XML root.
 
@@ -58,7 +182,7 @@ class LxmlParser:
             The XML root node
 
         """
-        return self._tree.getroot()
+        return self._root
 
     def lxml_version(self) -> str:
         """lxml version tag.
@@ -76,7 +200,7 @@ class LxmlParser:
             The XML document type
 
         """
-        return self._tree.docinfo.public_id
+        return self._docinfo.get("public_id")
 
     def doc_url(self) -> str:
         """
@@ -84,7 +208,7 @@ class LxmlParser:
             The XML document url
 
         """
-        return self._tree.docinfo.URL
+        return self._docinfo.get("url")
 
     def doc_encoding(self) -> str:
         """
@@ -93,7 +217,7 @@ class LxmlParser:
             The XML document encoding
 
         """
-        return self._tree.docinfo.encoding
+        return self._docinfo.get("encoding")
 
     def doc_root_name(self) -> str:
         """
@@ -102,7 +226,7 @@ class LxmlParser:
             The XML document root name
 
         """
-        return self._tree.docinfo.root_name
+        return self._docinfo.get("root_name")
 
     def doc_system_url(self) -> str:
         """
@@ -111,7 +235,7 @@ class LxmlParser:
             The XML document system URL
 
         """
-        return self._tree.docinfo.system_url
+        return self._docinfo.get("system_url")
 
     def doc_xml_version(self) -> str:
         """
@@ -120,33 +244,34 @@ class LxmlParser:
            The XML document version
 
         """
-        return self._tree.docinfo.xml_version
+        return self._docinfo.get("xml_version")
+
+    def get_namespaces(self) -> Mapping:
+        """The defined namespaces of (prefix, namespace) as (key,value) pairs.
+
+        Returns:
+            A read-only mapping of (prefix, namespace) as (key,value) pairs
+
+        """
+        return self._namespaces
 
-    def get_namespaces(self) -> Dict:
-        """The dict of the defined namespaces of (prefix, namespace) as (key,value) pairs.
+    def get_prefix_map(self) -> Mapping:
+        """The prefixes of the defined namespaces.
 
         Returns:
-            (prefix, namespace) as (key,value) pairs
+            A read-only mapping of (namespace, prefix) as (key,value) pairs
 
         """
-        root = self.get_root()
-        if __debug__:
-            if root is None:
-                raise AssertionError(f"{__name__}: The root node is None")
-        return root.nsmap
+        return self._prefixes
 
-    def get_target_namespace(self) -> str:
+    def get_target_namespace(self) -> Optional[str]:
         """The target namespace of the schema.
 
         Returns:
-            The target namespace as a str
+            The target namespace as a str, None if the schema has no target namespace
 
         """
-        root = self.get_root()
-        if __debug__:
-            if root is None:
-                raise AssertionError(f"{__name__}: The root node is None")
-        return root.get("targetNamespace")
+        return self._target_namespace
 
     def get_referenced_files(self) -> Dict:
         """The XML imports  (xs:import tags).
@@ -155,14 +280,86 @@ class LxmlParser:
             A dict of key, value pairs (namespace: location/URL) of all xs:import tags.
 
         """
-        root = self.get_root()
-        if __debug__:
-            if root is None:
-                raise AssertionError(f"{__name__}: The root node is None")
-        urls = {}
-        references = LxmlElement.find_all_children_with_name(root, "import")
-        for ref in references:
-            loc = ref.get("schemaLocation")
-            ns = ref.get("namespace")
-            urls[ns] = loc
-        return urls
+        if self._referenced_files is None:
+            urls = {}
+            references = LxmlElement.iter_children_with_name(self._root, "import")
+            for ref in references:
+                loc = ref.get("schemaLocation")
+                ns = ref.get("namespace")
+                urls[ns] = loc
+            self._referenced_files = urls
+        # Hand out a copy, the cached imports are not to be modified by the caller
+        return dict(self._referenced_files)
+
+    def count_by_tag(self) -> Counter:
+        """The number of elements in the document per local name.
+
+        The elements are counted in a single pass on the first call. Comments and processing instructions
+        are not counted.
+
+        Returns:
+            A ``Counter`` with the element local name as key, example: ``{"element": 1200, "complexType": 202}``
+
+        """
+        if self._tag_counts is None:
+            self._tag_counts = Counter(
+                element.tag.rpartition("}")[2]
+                for element in self._root.iter(etree.Element)
+            )
+        # Hand out a copy, the cached counts are not to be modified by the caller
+        return Counter(self._tag_counts)
+
+    def find_all_with_attribute_value(
+        self, name: str, attrib_name: str, attrib_value: str
+    ) -> List:
+        """Find all the elements ``name`` below the root with the attribute ``attrib_name`` having the value
+        ``attrib_value``.
+
+        Same result as ``LxmlElement.find_all_children_with_attribute_value`` on the root in the wildcard namespace,
+        but the elements are indexed by attribute value on the first query for a (name, attrib_name) pair.
+
+        Args:
+            name: The name of the element with attrib_name and attrib_value
+            attrib_name: The name of the attribute
+            attrib_value: The value of the attribute
+
+        Returns:
+            All elements having attributes with name ``attrib_name`` and value ``attrib_value``.
+            Empty list if no elements can be found
+
+        """
+        key = (name, attrib_name)
+        index = self._attribute_index.get(key)
+        if index is None:
+            index = defaultdict(list)
+            for element in self._root.iterdescendants(f"{{*}}{name}"):
+                value = element.get(attrib_name)
+                if value is not None:
+                    index[value].append(element)
+            self._attribute_index[key] = index
+        return list(index.get(attrib_value, ()))
+
+    def xpath(self, expression: str, **variables) -> Any:
+        """Evaluate an XPath expression on the document.
+
+        The evaluator is created once per document with the namespace prefixes of the root node.
+        Use it for repeated queries instead of ``Element.xpath``.
+
+        Args:
+            expression: The XPath expression, with the document prefixes. Example: ``//xs:element[@name=$name]``
+            variables: The values of the XPath variables used in the expression
+
+        Returns:
+            The XPath result, a list of nodes for a node-set
+
+        """
+        if self._evaluator is None:
+            namespaces = {
+                prefix: namespace
+                for prefix, namespace in self._namespaces.items()
+                if prefix is not None
+            }
+            self._evaluator = etree.XPathDocumentEvaluator(
+                self._tree, namespaces=namespaces
+            )
+        return self._evaluator(expression, **variables)
@@ -1,5 +1,8 @@
 #  Copyright (c) 2022-2024. OCX Consortium https://3docx.org. See the LICENSE
 
+import shutil
+from pathlib import Path
+from urllib.error import HTTPError, URLError
 
 import pytest
 
@@ -13,41 +16,82 @@ from ocx_schema_parser.xparse import LxmlParser
 # sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
 
 
-@pytest.fixture
-def load_schema_from_file(shared_datadir) -> LxmlParser:
+# The xdist group of the tests using each of the session scoped schema fixtures
+_XDIST_GROUPS = {
+    "transformer_from_url": "schema_url",
+    "load_schema_from_file": "schema_file",
+    "process_schema": "schema_file",
+    "transformer_from_folder": "schema_file",
+}
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run the marked tests in the same xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(items):
+    """Group the tests by schema fixture, so that ``pytest -n auto --dist loadgroup`` parses each schema once."""
+    for item in items:
+        for fixture in item.fixturenames:
+            if fixture in _XDIST_GROUPS:
+                item.add_marker(pytest.mark.xdist_group(_XDIST_GROUPS[fixture]))
+                break
+
+
+@pytest.fixture(scope="session")
+def schema_folder(tmp_path_factory) -> Path:
+    """A copy of the test data folder shared by the session scoped schema fixtures."""
+    folder = tmp_path_factory.mktemp("schema") / "data"
+    shutil.copytree(Path(__file__).parent / "data", folder)
+    return folder
+
+
+@pytest.fixture(scope="session")
+def load_schema_from_file(schema_folder) -> LxmlParser:
     """Load the schema from file and make it available for processing."""
     parser = LxmlParser()
-    file = shared_datadir / "OCX_Schema.xsd"
+    file = schema_folder / "OCX_Schema.xsd"
     parser.parse(file.absolute())
     assert parser.lxml_version() == (5, 1, 0, 0)
     return parser
 
 
-@pytest.fixture
-def process_schema(shared_datadir, load_schema_from_file) -> OcxParser:
+@pytest.fixture(scope="session")
+def process_schema(schema_folder) -> OcxParser:
     """Process the schema and make it available for testing."""
-    schema_folder = shared_datadir
     folder = schema_folder.resolve()
     parser = OcxParser()
-    for file in resolve_source(str(folder), True):
-        result = parser.process_xsd_from_file(file)
-        assert result is True
+    result = parser.process_xsd_files(resolve_source(str(folder), True))
+    assert result is True
     return parser
 
 
-@pytest.fixture
-def transformer_from_folder(shared_datadir) -> Transformer:
+@pytest.fixture(scope="session")
+def transformer_from_folder(schema_folder) -> Transformer:
     """Process the schema and make it available for testing."""
     transformer = Transformer()
-    transformer.transform_schema_from_folder(shared_datadir)
+    transformer.transform_schema_from_folder(schema_folder)
     assert transformer.is_transformed() is True
     return transformer
 
 
-@pytest.fixture
-def transformer_from_url(shared_datadir, load_schema_from_file) -> Transformer:
-    """Process the schema and make it available for testing."""
+@pytest.fixture(scope="session")
+def transformer_from_url(tmp_path_factory) -> Transformer:
+    """Download and process the schema once per session and make it available for testing.
+
+    The dependent tests are skipped if the schema url cannot be reached.
+    """
     transformer = Transformer()
-    transformer.transform_schema_from_url(DEFAULT_SCHEMA, shared_datadir)
+    try:
+        transformer.transform_schema_from_url(
+            DEFAULT_SCHEMA, tmp_path_factory.mktemp("schema_url")
+        )
+    except URLError as e:
+        # An HTTP error status means the server answered, the schema url is wrong
+        if isinstance(e, HTTPError):
+            raise
+        pytest.skip(f"The schema url {DEFAULT_SCHEMA} is not reachable: {e}")
     assert transformer.is_transformed() is True
     return transformer
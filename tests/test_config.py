@@ -1,6 +1,7 @@
 #  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
 
 from ocx_schema_parser import config
+from ocx_schema_parser.config import get_list
 
 
 def test_schema_url():
@@ -61,3 +62,11 @@ def test_w3c_schema_builtin_types(data_regression):
     values = config.get("SchemaParserSettings", "w3c_schema_builtin_values").split()
     result = dict(zip(keys, values))
     data_regression.check(result)
+
+
+def test_get_list():
+    values = get_list("SchemaParserSettings", "process_schema_types")
+    assert values == tuple(
+        config.get("SchemaParserSettings", "process_schema_types").split()
+    )
+    assert get_list("SchemaParserSettings", "process_schema_types") is values
@@ -1,6 +1,10 @@
 #  Copyright (c) 2023. OCX Consortium https://3docx.org. See the LICENSE
 
 from pathlib import Path
+from urllib.error import HTTPError, URLError
+
+import pytest
+from xsdata.exceptions import ParserError
 
 from ocx_schema_parser import WORKING_DRAFT
 from ocx_schema_parser.ocxdownloader.downloader import SchemaDownloader
@@ -8,6 +12,93 @@ from ocx_schema_parser.ocxdownloader.downloader import SchemaDownloader
 
 def test_download(datadir: Path):
     downloader = SchemaDownloader(datadir)
-    downloader.wget(WORKING_DRAFT)
+    try:
+        downloader.wget(WORKING_DRAFT)
+    except URLError as e:
+        # An HTTP error status means the server answered, the schema url is wrong
+        if isinstance(e, HTTPError):
+            raise
+        pytest.skip(f"The schema url {WORKING_DRAFT} is not reachable: {e}")
     files = list(datadir.glob("*.xsd"))
     assert len(files) == 3
+
+
+def test_download_imports(tmp_path: Path):
+    source = tmp_path / "source"
+    source.mkdir()
+    xs = 'xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+    for name in ["a", "b"]:
+        (source / f"{name}.xsd").write_text(
+            f'<xs:schema {xs} targetNamespace="urn:{name}"/>', encoding="utf-8"
+        )
+    imports = "".join(
+        f'<xs:import namespace="urn:{name}" schemaLocation="{name}.xsd"/>'
+        for name in ["a", "b"]
+    )
+    (source / "main.xsd").write_text(
+        f'<xs:schema {xs} targetNamespace="urn:main">{imports}</xs:schema>',
+        encoding="utf-8",
+    )
+    output = tmp_path / "output"
+    output.mkdir()
+    downloader = SchemaDownloader(output)
+    downloader.wget((source / "main.xsd").as_uri())
+    files = sorted(file.name for file in output.glob("*.xsd"))
+    assert files == ["a.xsd", "b.xsd", "main.xsd"]
+    assert downloader.prefetched == {}
+
+
+def test_download_skipped_import(tmp_path: Path):
+    # main.xsd imports sub/a.xsd and b.xsd, sub/a.xsd imports sub/b.xsd with the same schema location b.xsd
+    source = tmp_path / "source"
+    (source / "sub").mkdir(parents=True)
+    xs = 'xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+    for file in [source / "b.xsd", source / "sub" / "b.xsd"]:
+        file.write_text(f'<xs:schema {xs} targetNamespace="urn:b"/>', encoding="utf-8")
+    (source / "sub" / "a.xsd").write_text(
+        f'<xs:schema {xs} targetNamespace="urn:a">'
+        '<xs:import namespace="urn:b" schemaLocation="b.xsd"/></xs:schema>',
+        encoding="utf-8",
+    )
+    (source / "main.xsd").write_text(
+        f'<xs:schema {xs} targetNamespace="urn:main">'
+        '<xs:import namespace="urn:a" schemaLocation="sub/a.xsd"/>'
+        '<xs:import namespace="urn:b" schemaLocation="b.xsd"/></xs:schema>',
+        encoding="utf-8",
+    )
+    output = tmp_path / "output"
+    output.mkdir()
+    downloader = SchemaDownloader(output)
+    downloader.wget((source / "main.xsd").as_uri())
+    assert (source / "b.xsd").as_uri() not in downloader.downloaded
+    assert downloader.prefetched == {}
+
+
+@pytest.mark.parametrize(
+    "names, bad_content",
+    [(["a", "bad"], None), (["bad", "a"], "not a schema")],
+    ids=["missing", "not_parsed"],
+)
+def test_download_failed_import(tmp_path: Path, names, bad_content):
+    # The download of a missing bad.xsd fails after a.xsd is fetched,
+    # the parse of bad.xsd fails before a.xsd is processed
+    xs = 'xmlns:xs="http://www.w3.org/2001/XMLSchema"'
+    (tmp_path / "a.xsd").write_text(
+        f'<xs:schema {xs} targetNamespace="urn:a"/>', encoding="utf-8"
+    )
+    if bad_content is not None:
+        (tmp_path / "bad.xsd").write_text(bad_content, encoding="utf-8")
+    imports = "".join(
+        f'<xs:import namespace="urn:{name}" schemaLocation="{name}.xsd"/>'
+        for name in names
+    )
+    (tmp_path / "main.xsd").write_text(
+        f'<xs:schema {xs} targetNamespace="urn:main">{imports}</xs:schema>',
+        encoding="utf-8",
+    )
+    output = tmp_path / "output"
+    output.mkdir()
+    downloader = SchemaDownloader(output)
+    with pytest.raises((URLError, ParserError)):
+        downloader.wget((tmp_path / "main.xsd").as_uri())
+    assert downloader.prefetched == {}
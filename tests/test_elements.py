@@ -35,3 +35,25 @@ class TestOcxGlobalElement:
         item = transformer_from_folder.get_ocx_element_from_type("ocx:Panel")
         result = {attr.name: attr.to_dict() for attr in item.get_children()}
         data_regression.check(result)
+
+    def test_children_table(self, transformer_from_folder: Transformer):
+        item = transformer_from_folder.get_ocx_element_from_type("ocx:Panel")
+        headers, rows = item.children_table
+        children = item.children_to_dict()
+        assert headers == list(children)
+        assert [row[0] for row in rows] == children["Child"]
+
+    def test_get_attribute_by_name(self, transformer_from_folder: Transformer):
+        item = transformer_from_folder.get_ocx_element_from_type("ocx:Panel")
+        attribute = item.get_attribute_by_name("functionType")
+        assert attribute.name == "functionType"
+        assert item.get_attribute_by_name("NoSuchAttribute") is None
+
+    def test_substitution_group(self, transformer_from_folder: Transformer):
+        panel = transformer_from_folder.get_ocx_element_from_type("ocx:Panel")
+        assert panel.is_substitution_group() is False
+        assert panel.get_substitution_group() is None
+        curve = transformer_from_folder.get_ocx_element_from_type("ocx:Curve3D")
+        assert curve.is_substitution_group() is True
+        assert curve.get_substitution_group() == "ocx:GeometryRepresentation"
+        assert curve.is_abstract() is True
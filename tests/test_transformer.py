@@ -15,32 +15,44 @@ class TestTransformer:
         vessel = transformer_from_folder.get_ocx_element_from_type("ocx:Vessel")
         assert vessel
 
+    def test_get_ocx_element_with_name(self, transformer_from_folder: Transformer):
+        vessel = transformer_from_folder.get_ocx_element_with_name("Vessel")
+        assert vessel.get_name() == "Vessel"
+        assert transformer_from_folder.get_ocx_element_with_name("NoSuchName") is None
+
+    def test_retransform_lookup_tables(self, schema_folder):
+        transformer = Transformer()
+        assert transformer.transform_schema_from_folder(schema_folder)
+        first = transformer.get_ocx_element_with_name("Vessel")
+        assert transformer.transform_schema_from_folder(schema_folder)
+        vessel = transformer.get_ocx_element_with_name("Vessel")
+        assert vessel is not first
+        assert vessel is transformer.get_ocx_element_from_type("ocx:Vessel")
+        assert any(vessel is ocx for ocx in transformer.get_ocx_elements())
+
+    def test_get_global_attribute_with_name(self, transformer_from_folder: Transformer):
+        guid = transformer_from_folder.get_global_attribute_with_name("GUIDRef")
+        assert guid.name == "GUIDRef"
+
     def test_get_enumerators(
         self, data_regression, transformer_from_folder: Transformer
     ):
+        enums = transformer_from_folder.get_enumerators()
         result = {
             name: {"Prefix": enum.prefix, "Tag": enum.tag}
-            for name, enum in transformer_from_folder.get_enumerators().items()
+            for name, enum in sorted(enums.items())
         }
         data_regression.check(result)
 
     def test_get_global_attributes(
         self, data_regression, transformer_from_folder: Transformer
     ):
-        result = {
-            enum.name: enum.to_dict()
-            for enum in transformer_from_folder.get_global_attributes()
-        }
-        data_regression.check(result)
+        data_regression.check(transformer_from_folder.global_attributes_as_dict)
 
     def test_get_simple_types(
         self, data_regression, transformer_from_folder: Transformer
     ):
-        result = {
-            enum.name: enum.to_dict()
-            for enum in transformer_from_folder.get_simple_types()
-        }
-        data_regression.check(result)
+        data_regression.check(transformer_from_folder.simple_types_as_dict)
 
     def test_is_transformed_from_url(self, transformer_from_url: Transformer):
         assert transformer_from_url.is_transformed()
@@ -65,15 +77,9 @@ class TestTransformer:
     def test_get_enumerators_from_url(
         self, data_regression, transformer_from_url: Transformer
     ):
-        enums = transformer_from_url.get_enumerators()
-        result = {enum: enums[enum].to_dict() for enum in enums}
-        data_regression.check(result)
+        data_regression.check(transformer_from_url.enumerators_as_dict)
 
     def test_get_global_attributes_from_url(
         self, data_regression, transformer_from_url: Transformer
     ):
-        result = {
-            enum.name: enum.to_dict()
-            for enum in transformer_from_url.get_global_attributes()
-        }
-        data_regression.check(result)
+        data_regression.check(transformer_from_url.global_attributes_as_dict)
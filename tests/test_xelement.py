@@ -1,4 +1,6 @@
 #  Copyright (c) 2022-2023. OCX Consortium https://3docx.org. See the LICENSE
+from lxml import etree
+
 from ocx_schema_parser.xparse import LxmlElement
 
 
@@ -38,17 +40,17 @@ class TestLxmlElement:
 
     def test_unique_tag(self, load_schema_from_file):
         root = load_schema_from_file.get_root()
-        vessel = LxmlElement.find_all_children_with_attribute_value(
+        vessel = LxmlElement.find_first_child_with_attribute_value(
             root, "element", "name", "Vessel"
-        )[0]
+        )
         name = LxmlElement.unique_tag(vessel)
         assert name == "{http://www.w3.org/2001/XMLSchema}Vessel"
 
     def test_get_name(self, load_schema_from_file):
         root = load_schema_from_file.get_root()
-        vessel = LxmlElement.find_all_children_with_attribute_value(
+        vessel = LxmlElement.find_first_child_with_attribute_value(
             root, "element", "name", "Vessel"
-        )[0]
+        )
         name = LxmlElement.get_name(vessel)
         assert name == "Vessel"
 
@@ -80,30 +82,30 @@ class TestLxmlElement:
 
     def test_is_substitution_group(self, load_schema_from_file):
         root = load_schema_from_file.get_root()
-        vessel = LxmlElement.find_all_children_with_attribute_value(
+        vessel = LxmlElement.find_first_child_with_attribute_value(
             root, "element", "name", "Vessel"
-        )[0]
+        )
         assert LxmlElement.is_substitution_group(vessel) is True
 
     def test_is_abstract(self, load_schema_from_file):
         root = load_schema_from_file.get_root()
-        element = LxmlElement.find_all_children_with_attribute_value(
+        element = LxmlElement.find_first_child_with_attribute_value(
             root, "element", "name", "Curve3D"
-        )[0]
+        )
         assert LxmlElement.is_abstract(element) is True
 
     def test_get_substitution_group(self, load_schema_from_file):
         root = load_schema_from_file.get_root()
-        vessel = LxmlElement.find_all_children_with_attribute_value(
+        vessel = LxmlElement.find_first_child_with_attribute_value(
             root, "element", "name", "Vessel"
-        )[0]
+        )
         assert LxmlElement.get_substitution_group(vessel) == "ocx:Form"
 
     def test_get_element_text(self, load_schema_from_file):
         root = load_schema_from_file.get_root()
-        vessel = LxmlElement.find_all_children_with_attribute_value(
+        vessel = LxmlElement.find_first_child_with_attribute_value(
             root, "element", "name", "Vessel"
-        )[0]
+        )
         text = LxmlElement.get_element_text(vessel)
         assert text == "Vessel asset subject to Classification."
 
@@ -121,11 +123,18 @@ class TestLxmlElement:
         children = LxmlElement.find_all_children_with_name(root, "complexType")
         assert len(children) == 202
 
+    def test_iter_children_with_name(self, load_schema_from_file):
+        root = load_schema_from_file.get_root()
+        children = LxmlElement.iter_children_with_name(root, "complexType")
+        assert list(children) == LxmlElement.find_all_children_with_name(
+            root, "complexType"
+        )
+
     def test_find_child_with_name(self, load_schema_from_file):
         root = load_schema_from_file.get_root()
-        vessel = LxmlElement.find_all_children_with_attribute_value(
+        vessel = LxmlElement.find_first_child_with_attribute_value(
             root, "element", "name", "Vessel"
-        )[0]
+        )
         child = LxmlElement.find_child_with_name(vessel, "annotation")
         assert len(child) == 1
 
@@ -141,9 +150,9 @@ class TestLxmlElement:
 
     def test_has_child_with_name(self, load_schema_from_file):
         root = load_schema_from_file.get_root()
-        vessel = LxmlElement.find_all_children_with_attribute_value(
+        vessel = LxmlElement.find_first_child_with_attribute_value(
             root, "element", "name", "Vessel"
-        )[0]
+        )
         assert LxmlElement.has_child_with_name(vessel, "annotation") is True
 
     def test_find_all_children_with_attribute_value(self, load_schema_from_file):
@@ -154,6 +163,31 @@ class TestLxmlElement:
         )[0]
         assert child.get("fixed") == "2.8.6"
 
+    def test_find_first_child_with_attribute_value(self, load_schema_from_file):
+        root = load_schema_from_file.get_root()
+        for name in ["Vessel", "NoSuchName"]:
+            first = LxmlElement.find_first_child_with_attribute_value(
+                root, "element", "name", name
+            )
+            children = LxmlElement.find_all_children_with_attribute_value(
+                root, "element", "name", name
+            )
+            assert first is (children[0] if children else None)
+
+    def test_find_all_children_with_attribute_value_quotes(self):
+        # The value is compared as is, quotes need no escaping
+        root = etree.fromstring(
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+            '<xs:element name="it\'s"/>'
+            "<xs:element name='say \"hi\"'/>"
+            "</xs:schema>"
+        )
+        for name in ["it's", 'say "hi"']:
+            children = LxmlElement.find_all_children_with_attribute_value(
+                root, "element", "name", name
+            )
+            assert [child.get("name") for child in children] == [name]
+
     def test_find_all_children_with_name_and_attribute(self, load_schema_from_file):
         root = load_schema_from_file.get_root()
         children = LxmlElement.find_all_children_with_name_and_attribute(
@@ -1,4 +1,6 @@
 #  Copyright (c) 2022. OCX Consortium https://3docx.org. See the LICENSE
+from ocx_schema_parser.xelement import LxmlElement
+from ocx_schema_parser.xparse import LxmlParser
 
 
 class TestLxmlParser:
@@ -20,7 +22,12 @@ class TestLxmlParser:
 
     def test_get_namespaces(self, data_regression, load_schema_from_file):
         namespaces = load_schema_from_file.get_namespaces()
-        data_regression.check(namespaces)
+        data_regression.check(dict(namespaces))
+
+    def test_get_prefix_map(self, load_schema_from_file):
+        prefixes = load_schema_from_file.get_prefix_map()
+        assert prefixes["http://data.dnvgl.com/Schemas/ocxXMLSchema"] == "ocx"
+        assert prefixes["http://www.w3.org/2001/XMLSchema"] == "xs"
 
     def test_get_target_namespace(self, data_regression, load_schema_from_file):
         target_namespace = {"namespace": load_schema_from_file.get_target_namespace()}
@@ -29,3 +36,66 @@ class TestLxmlParser:
     def test_get_referenced_files(self, data_regression, load_schema_from_file):
         referenced_files = load_schema_from_file.get_referenced_files()
         data_regression.check(referenced_files)
+
+    def test_parse_skip_annotations(self, shared_datadir, load_schema_from_file):
+        parser = LxmlParser()
+        assert parser.parse(shared_datadir / "OCX_Schema.xsd", skip_annotations=True)
+        root = parser.get_root()
+        assert LxmlElement.find_all_children_with_name(root, "annotation") == []
+        blank = [
+            text
+            for element in root.iter()
+            for text in (element.text, element.tail)
+            if text is not None and not text.strip()
+        ]
+        assert blank == []
+        assert parser.get_namespaces() == load_schema_from_file.get_namespaces()
+        assert (
+            parser.get_referenced_files()
+            == load_schema_from_file.get_referenced_files()
+        )
+        full = load_schema_from_file.get_root()
+        assert len(LxmlElement.find_all_children_with_name(root, "element")) == len(
+            LxmlElement.find_all_children_with_name(full, "element")
+        )
+
+    def test_find_all_with_attribute_value(self, load_schema_from_file):
+        root = load_schema_from_file.get_root()
+        for name in ["Vessel", "Panel", "NoSuchName"]:
+            assert load_schema_from_file.find_all_with_attribute_value(
+                "element", "name", name
+            ) == LxmlElement.find_all_children_with_attribute_value(
+                root, "element", "name", name
+            )
+
+    def test_parse_reuses_parser(self, shared_datadir):
+        first = LxmlParser()
+        second = LxmlParser()
+        assert first.parse(shared_datadir / "OCX_Schema.xsd")
+        assert second.parse(shared_datadir / "unitsmlSchema_lite-0.9.18.xsd")
+        assert first.doc_url() != second.doc_url()
+        assert first.get_target_namespace() == (
+            "http://data.dnvgl.com/Schemas/ocxXMLSchema"
+        )
+
+    def test_xpath(self, load_schema_from_file):
+        root = load_schema_from_file.get_root()
+        elements = load_schema_from_file.xpath(
+            "/xs:schema/xs:element[@name=$name]", name="Vessel"
+        )
+        assert elements == LxmlElement.find_all_children_with_attribute_value(
+            root, "element", "name", "Vessel"
+        )
+        assert load_schema_from_file.xpath("count(//xs:attributeGroup)") == len(
+            LxmlElement.find_attribute_groups(root)
+        )
+
+    def test_count_by_tag(self, load_schema_from_file):
+        root = load_schema_from_file.get_root()
+        counts = load_schema_from_file.count_by_tag()
+        assert counts["schema"] == 1
+        assert counts["complexType"] == len(
+            LxmlElement.find_all_children_with_name(root, "complexType")
+        )
+        assert counts["attributeGroup"] == 8
+        assert sum(counts.values()) == len(LxmlElement.get_children(root)) + 1